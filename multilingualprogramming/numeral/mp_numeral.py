@@ -7,16 +7,26 @@
 """Functions to handle numbers of multiple languages
 """
 
-from operator import invert, neg
+from operator import (  # pylint: disable=redefined-builtin
+    add,
+    floordiv,
+    invert,
+    lshift,
+    mod,
+    mul,
+    neg,
+    or_,
+    pow,
+    rshift,
+    sub,
+    truediv,
+    xor,
+)
 from roman import toRoman
 from multilingualprogramming.unicode_string import get_unicode_character_string
 import multilingualprogramming.numeral.unicode_numeral as un
 import multilingualprogramming.numeral.roman_numeral as rn
-from multilingualprogramming.exceptions import (
-    MultipleLanguageCharacterMixError,
-    InvalidNumeralCharacterError,
-    DifferentNumeralTypeError
-)
+from multilingualprogramming.exceptions import DifferentNumeralTypeError
 
 
 class MPNumeral:
@@ -28,18 +38,17 @@ class MPNumeral:
     def __init__(self, numstr: str):
         self.numstr = numstr
         self.num = None
-        try:
-            if rn.RomanNumeral.is_roman_numeral(numstr):
-                self.num = rn.RomanNumeral(numstr)  # create a Roman numeral
-                self.numeral_type = "Roman"
-            else:
-                self.num = un.UnicodeNumeral(numstr)  # create a Unicode numeral
-                self.numeral_type = "Unicode"
-        except (
-            MultipleLanguageCharacterMixError,
-            InvalidNumeralCharacterError,
-        ) as exception:
-            raise exception
+        # MultipleLanguageCharacterMixError and InvalidNumeralCharacterError
+        # raised by the numeral classes propagate to the caller
+        if rn.RomanNumeral.is_roman_numeral(numstr):
+            self.num = rn.RomanNumeral(numstr)  # create a Roman numeral
+            self.numeral_type = "Roman"
+        else:
+            self.num = un.UnicodeNumeral(numstr)  # create a Unicode numeral
+            self.numeral_type = "Unicode"
+        # Decoded on the first call to to_decimal()
+        self.decoded = False
+        self.value = None
 
     def to_decimal(self):
         """
@@ -49,9 +58,36 @@ class MPNumeral:
         return:
            number: number associated with the number string
         """
-        if self.num:
-            return self.num.to_decimal()
-        return None
+        if not self.decoded:
+            # Decode once, arithmetic operations reuse the decoded value
+            self.value = self.num.to_decimal()
+            self.decoded = True
+        return self.value
+
+    def __int__(self):
+        """
+        Returns the integer (Multilingual Numeral) associated with the number string
+
+        return:
+           number: integer associated with the number string
+        """
+        value = self.to_decimal()
+        if value is None:
+            raise TypeError("Not a valid numeral: " + self.numstr)
+        return int(value)
+
+    def __index__(self):
+        """
+        Returns the integer (Multilingual Numeral) to be used as an index
+        or with bin(), oct() and hex()
+
+        return:
+           number: integer associated with the number string
+        """
+        value = self.to_decimal()
+        if not isinstance(value, int):
+            raise TypeError("Not an integer numeral: " + self.numstr)
+        return value
 
     def __str__(self):
         """
@@ -108,7 +144,7 @@ class MPNumeral:
         Returns:
             MPNumeral: The sum of the MPNumeral values.
         """
-        return self._perform_operation(numeral, lambda x, y: x + y)
+        return self._perform_operation(numeral, add)
 
     def __mul__(self, numeral):
         """
@@ -117,7 +153,7 @@ class MPNumeral:
         Returns:
             MPNumeral: The product of the MPNumeral values.
         """
-        return self._perform_operation(numeral, lambda x, y: x * y)
+        return self._perform_operation(numeral, mul)
 
     def __lshift__(self, numeral):
         """
@@ -126,7 +162,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the left shifted value
         """
-        return self._perform_operation(numeral, lambda x, y: x << y)
+        return self._perform_operation(numeral, lshift)
 
     def __rshift__(self, numeral):
         """
@@ -135,7 +171,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the right shifted value
         """
-        return self._perform_operation(numeral, lambda x, y: x >> y)
+        return self._perform_operation(numeral, rshift)
 
     def __sub__(self, numeral):
         """
@@ -144,7 +180,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the difference
         """
-        return self._perform_operation(numeral, lambda x, y: x - y)
+        return self._perform_operation(numeral, sub)
 
     def __truediv__(self, numeral):
         """
@@ -153,7 +189,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the value after true division
         """
-        return self._perform_operation(numeral, lambda x, y: x / y)
+        return self._perform_operation(numeral, truediv)
 
     def __floordiv__(self, numeral):
         """
@@ -162,7 +198,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the value after floor division
         """
-        return self._perform_operation(numeral, lambda x, y: x // y)
+        return self._perform_operation(numeral, floordiv)
 
     def __neg__(self):
         """
@@ -180,7 +216,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the power
         """
-        return self._perform_operation(numeral, lambda x, y: x**y)
+        return self._perform_operation(numeral, pow)
 
     def __mod__(self, numeral):
         """
@@ -189,7 +225,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the modulus value
         """
-        return self._perform_operation(numeral, lambda x, y: x % y)
+        return self._perform_operation(numeral, mod)
 
     def __xor__(self, numeral):
         """
@@ -198,7 +234,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the XOR value
         """
-        return self._perform_operation(numeral, lambda x, y: x ^ y)
+        return self._perform_operation(numeral, xor)
 
     def __invert__(self):
         """
@@ -207,12 +243,7 @@ class MPNumeral:
         return:
            MPNumeral: returns the bitwise-inverted value
         """
-        result = invert(self.to_decimal())
-        if self.numeral_type == "Roman":
-            result = toRoman(result)
-        else:
-            result = get_unicode_character_string(self.num.language_name, result)
-        return MPNumeral(result)
+        return self.to_mp_numeral(invert(self.to_decimal()))
 
     def __or__(self, numeral):
         """
@@ -221,4 +252,4 @@ class MPNumeral:
         return:
            MPNumeral: returns the OR value
         """
-        return self._perform_operation(numeral, lambda x, y: x | y)
+        return self._perform_operation(numeral, or_)
@@ -7,15 +7,18 @@
 """Functions to handle numbers of multiple languages
 """
 
-import unicodedata
-import re
 import locale
 from operator import invert, neg
 from multilingualprogramming.exceptions import (
     InvalidNumeralCharacterError,
     MultipleLanguageCharacterMixError,
 )
-from multilingualprogramming.unicode_string import get_unicode_character_string
+from multilingualprogramming.unicode_string import (
+    DIGIT_STRING,
+    get_digit_script,
+    get_integer,
+    get_unicode_character_string,
+)
 from multilingualprogramming.numeral.abstract_numeral import AbstractNumeral
 
 
@@ -29,19 +32,25 @@ class UnicodeNumeral(AbstractNumeral):
         """
         Verify the unicode category of each character
         """
+        if numstr.isascii() and numstr.isdigit():
+            # Plain ASCII digits, no need to verify each character
+            self.language_name = DIGIT_STRING
+            return
+        decimal_separator = None
         running_character_name = None
         for character in numstr:
-            if unicodedata.category(character) != "Nd":
-                # Handle decimal separators of all locales
-                decimal_separator = locale.localeconv()["decimal_point"]
-                if character in decimal_separator or character in ["-"]:
+            current_character_name = get_digit_script(character)
+            if current_character_name is None:
+                # Handle decimal separators of all locales, looked up once
+                # and only when a non-digit character is found
+                if decimal_separator is None:
+                    decimal_separator = locale.localeconv()["decimal_point"]
+                if character in decimal_separator or character == "-":
                     continue
 
                 raise InvalidNumeralCharacterError(
                     "Not a valid number, contains the character: " + character
                 )
-            current_character_name = unicodedata.name(character)
-            current_character_name = re.sub(r" .*$", "", current_character_name)
 
             if running_character_name is not None:
                 if running_character_name != current_character_name:
@@ -73,7 +82,7 @@ class UnicodeNumeral(AbstractNumeral):
         try:
             if "." in self.numstr:
                 return float(self.numstr)
-            return int(self.numstr)
+            return get_integer(self.numstr)
         except ValueError:
             return None
 
@@ -7,7 +7,13 @@
 """Functions to represent numbers in multiple languages
 """
 
+import locale
+import math
+import re
+import sys
 import unicodedata
+from decimal import Decimal
+from functools import lru_cache
 
 NUMBER_STRINGS = [
     "ZERO",
@@ -24,6 +30,13 @@ NUMBER_STRINGS = [
 
 DIGIT_STRING = "DIGIT"
 
+# Integers up to this number of digits are converted directly with str()
+# and int(), below the lowest int max-str-digits limit CPython allows (640)
+DECIMAL_STRING_THRESHOLD_DIGITS = 600
+
+# log10(2), to estimate the number of decimal digits from the bit length
+LOG10_2 = 0.30102999566398120
+
 
 def get_number_list(language: str):
     """
@@ -50,21 +63,124 @@ def get_unicode_character(language: str, numstr: str):
     return character
 
 
+@lru_cache(maxsize=None)
+def get_digit_script(character: str):
+    """
+    get the script name (e.g., MALAYALAM) of a decimal digit character,
+    None if the character is not a decimal digit
+    """
+    if unicodedata.category(character) != "Nd":
+        return None
+    return re.sub(r" .*$", "", unicodedata.name(character))
+
+
+@lru_cache(maxsize=64)
+def get_power_of_ten(exponent: int):
+    """
+    get 10 to the power of exponent, cached as the same powers are reused
+    while splitting large integers
+    """
+    return 10**exponent
+
+
+def get_int_max_str_digits():
+    """
+    get the interpreter's limit on the number of digits of integer string
+    conversions, 0 if there is no limit
+    """
+    if hasattr(sys, "get_int_max_str_digits"):
+        return sys.get_int_max_str_digits()
+    return 0
+
+
+def get_decimal_string(number: int):
+    """
+    get the decimal (ASCII) digit string of a number, large integers are
+    split recursively by powers of ten instead of being converted at once
+    """
+    if isinstance(number, float):
+        return get_fixed_point_string(number)
+    if not isinstance(number, int):
+        return str(number)
+    max_digits = get_int_max_str_digits()
+    if max_digits and abs(number) >= get_power_of_ten(max_digits):
+        raise ValueError(
+            f"Exceeds the limit ({max_digits} digits) for integer string conversion"
+        )
+    if number < 0:
+        return "-" + get_decimal_string_of_integer(-number)
+    return get_decimal_string_of_integer(number)
+
+
+def get_fixed_point_string(number: float):
+    """
+    get the decimal (ASCII) digit string of a float in fixed-point notation
+    (no exponent), with the decimal point of the current locale
+    """
+    if not math.isfinite(number):
+        raise ValueError("Not a finite number: " + str(number))
+    numstr = format(Decimal(repr(number)), "f")
+    if "." not in numstr:
+        numstr = numstr + ".0"
+    return numstr.replace(".", locale.localeconv()["decimal_point"])
+
+
+def get_decimal_string_of_integer(number: int):
+    """
+    get the decimal (ASCII) digit string of a non-negative integer
+    """
+    if number.bit_length() * LOG10_2 < DECIMAL_STRING_THRESHOLD_DIGITS:
+        return str(number)
+    low_digits = int(number.bit_length() * LOG10_2) // 2
+    high, low = divmod(number, get_power_of_ten(low_digits))
+    return get_decimal_string_of_integer(high) + get_decimal_string_of_integer(
+        low
+    ).zfill(low_digits)
+
+
+def get_integer(numstr: str):
+    """
+    get the integer of a string of decimal digits (of any script), long
+    strings are split in two and the halves converted recursively
+    """
+    if len(numstr) <= DECIMAL_STRING_THRESHOLD_DIGITS:
+        return int(numstr)
+    digits = numstr[1:] if numstr[0] == "-" else numstr
+    max_digits = get_int_max_str_digits()
+    if max_digits and len(digits) > max_digits:
+        raise ValueError(
+            f"Exceeds the limit ({max_digits} digits) for integer string conversion"
+        )
+    if numstr[0] == "-":
+        return -get_integer_of_digits(digits)
+    return get_integer_of_digits(digits)
+
+
+def get_integer_of_digits(digits: str):
+    """
+    get the integer of an unsigned string of decimal digits (of any script)
+    """
+    if not digits.isdecimal():
+        raise ValueError("Not a valid integer, contains non-digit characters")
+    if len(digits) <= DECIMAL_STRING_THRESHOLD_DIGITS:
+        return int(digits)
+    low_digits = len(digits) // 2
+    high = get_integer_of_digits(digits[:-low_digits])
+    low = get_integer_of_digits(digits[-low_digits:])
+    return high * get_power_of_ten(low_digits) + low
+
+
+@lru_cache(maxsize=None)
+def get_translation_table(language: str):
+    """
+    get the translation table from ASCII digits to the digits of a given language
+    """
+    return str.maketrans("0123456789", "".join(get_number_list(language)))
+
+
 def get_unicode_character_string(language: str, number: int):
     """
     get the unicode characters for the numbers in a given language
     """
-    numstr = str(number)
-    lookup_language = language
-    if language != DIGIT_STRING:
-        lookup_language = language + " " + DIGIT_STRING
-    unicode_numstr = ""
-    for character in numstr:
-        if character == "-":
-            unicode_numstr = character
-        else:
-            unicode_character = unicodedata.lookup(
-                lookup_language + " " + NUMBER_STRINGS[int(character)]
-            )
-            unicode_numstr = unicode_numstr + unicode_character
-    return unicode_numstr
+    numstr = get_decimal_string(number)
+    return numstr.translate(get_translation_table(language))
@@ -8,12 +8,15 @@
 Test suite for multilingual numerals
 """
 
+import sys
 import unittest
+from unittest import mock
 import locale
 import multilingualprogramming.numeral.mp_numeral as mpn
 from multilingualprogramming.exceptions import (
     MultipleLanguageCharacterMixError,
     InvalidNumeralCharacterError,
+    DifferentNumeralTypeError,
 )
 
 
@@ -109,6 +112,14 @@ class MPNumeralTestSuite(unittest.TestCase):
         result = num1 + num2
         self.assertTrue(result.to_decimal() == 9)
 
+        result = ~mpn.MPNumeral("൧൨")
+        self.assertTrue(str(result) == "-൧൩")
+
+        num1 = mpn.MPNumeral("V")  # create a numeral
+        num2 = mpn.MPNumeral("5")  # create a numeral
+        with self.assertRaises(DifferentNumeralTypeError):
+            num1 + num2  # pylint: disable=pointless-statement
+
     def test_negative_mp_numeral(self):
         """
         Test to create a base 10 numeral
@@ -123,3 +134,79 @@ class MPNumeralTestSuite(unittest.TestCase):
         num2 = mpn.MPNumeral("5")  # create a numeral
         result = num1 + num2
         self.assertTrue(result.to_decimal() == -7)
+
+    def test_mp_numeral_int_and_index(self):
+        """
+        Test to use MPNumeral as an integer
+        """
+        num1 = mpn.MPNumeral("XII")  # create a numeral
+        self.assertTrue(int(num1) == 12)
+        self.assertTrue([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12][num1] == 12)
+        num2 = mpn.MPNumeral("൧൩")  # create a numeral
+        self.assertTrue(int(num2) == 13)
+        self.assertTrue(hex(num2) == "0xd")
+        num3 = mpn.MPNumeral("12.34")  # create a numeral
+        self.assertTrue(int(num3) == 12)
+        with self.assertRaises(TypeError):
+            hex(num3)
+
+    def test_mp_numeral_lazy_decoding(self):
+        """
+        Test that Roman-like strings construct and are decoded on use
+        """
+        for numstr in ["ⅻ", "IIII", "VX", ""]:
+            num = mpn.MPNumeral(numstr)  # create a numeral
+            self.assertTrue(num.numeral_type == "Roman")
+        num = mpn.MPNumeral("1-2")  # create a numeral
+        self.assertTrue(num.to_decimal() is None)
+        with self.assertRaisesRegex(TypeError, "Not a valid numeral: 1-2"):
+            int(num)
+
+    def test_mp_numeral_float_results(self):
+        """
+        Test that float results can be used to create a MPNumeral
+        """
+        result = mpn.MPNumeral("٣") / mpn.MPNumeral("٢")
+        self.assertTrue(result.to_decimal() == 1.5)
+        self.assertTrue(mpn.MPNumeral(str(result)).to_decimal() == 1.5)
+        result = mpn.MPNumeral("٤") ** mpn.MPNumeral("-8")
+        self.assertTrue(result.to_decimal() == 4**-8)
+        result = mpn.MPNumeral("൧" + "൦" * 21) / mpn.MPNumeral("൧൦")
+        self.assertTrue(result.to_decimal() == 1e20)
+
+        with mock.patch("locale.localeconv", return_value={"decimal_point": ","}):
+            result = mpn.MPNumeral("1,5") + mpn.MPNumeral("1")
+            self.assertTrue(str(result) == "2,5")
+            self.assertTrue(result.to_decimal() == 2.5)
+            result = mpn.MPNumeral("٣") / mpn.MPNumeral("٢")
+            self.assertTrue(str(result) == "١,٥")
+            self.assertTrue(mpn.MPNumeral(str(result)).to_decimal() == 1.5)
+
+    @unittest.skipUnless(
+        hasattr(sys, "set_int_max_str_digits"), "no int max-str-digits limit"
+    )
+    def test_mp_numeral_above_digit_limit(self):
+        """
+        Test operations on numerals longer than the int max-str-digits limit
+        when it is disabled, and verify that the limit is enforced otherwise
+        """
+        original_limit = sys.get_int_max_str_digits()
+        try:
+            sys.set_int_max_str_digits(0)
+            result = mpn.MPNumeral("9") ** mpn.MPNumeral("9999")
+            self.assertTrue(result.to_decimal() == 9**9999)
+            result = result + mpn.MPNumeral("1")
+            self.assertTrue(result.to_decimal() == 9**9999 + 1)
+
+            result = mpn.MPNumeral("൯") ** mpn.MPNumeral("൯൯൯൯")
+            self.assertTrue(result.to_decimal() == 9**9999)
+            result = result - mpn.MPNumeral("൧")
+            self.assertTrue(result.to_decimal() == 9**9999 - 1)
+
+            sys.set_int_max_str_digits(640)
+            self.assertTrue(mpn.MPNumeral("7" * 1000).to_decimal() is None)
+            self.assertTrue(mpn.MPNumeral("൭" * 1000).to_decimal() is None)
+            with self.assertRaises(ValueError):
+                mpn.MPNumeral("9") ** mpn.MPNumeral("9999")  # pylint: disable=expression-not-assigned
+        finally:
+            sys.set_int_max_str_digits(original_limit)
@@ -8,8 +8,13 @@
 Test suite for multilingual numerals and associated operations
 """
 
+import locale
+import sys
 import unittest
 from multilingualprogramming.unicode_string import (
+    get_decimal_string,
+    get_digit_script,
+    get_integer,
     get_number_list,
     get_unicode_character,
     get_unicode_character_string,
@@ -63,3 +68,72 @@ class UnicodeStringTestSuite(unittest.TestCase):
         unicode_string = get_unicode_character_string("MALAYALAM", 12345)
         self.assertTrue(len(unicode_string) == 5)
         self.assertTrue(unicode_string == "൧൨൩൪൫")
+        unicode_string = get_unicode_character_string("MALAYALAM", -120)
+        self.assertTrue(unicode_string == "-൧൨൦")
+        decimal_point = locale.localeconv()["decimal_point"]
+        unicode_string = get_unicode_character_string("ARABIC-INDIC", 12.5)
+        self.assertTrue(unicode_string == "١٢" + decimal_point + "٥")
+        unicode_string = get_unicode_character_string("MALAYALAM", 1e20)
+        self.assertTrue(unicode_string == "൧" + "൦" * 20 + decimal_point + "൦")
+        unicode_string = get_unicode_character_string("DIGIT", 1.5e-05)
+        self.assertTrue(unicode_string == "0" + decimal_point + "000015")
+        with self.assertRaises(ValueError):
+            get_unicode_character_string("DIGIT", float("inf"))
+
+    def test_get_digit_script(self):
+        """
+        Get the script of a digit
+        """
+        self.assertTrue(get_digit_script("൧") == "MALAYALAM")
+        self.assertTrue(get_digit_script("٣") == "ARABIC-INDIC")
+        self.assertTrue(get_digit_script("7") == "DIGIT")
+        self.assertTrue(get_digit_script("a") is None)
+
+    def test_get_decimal_string(self):
+        """
+        Get decimal string of small, negative and large numbers
+        """
+        self.assertTrue(get_decimal_string(12345) == "12345")
+        self.assertTrue(get_decimal_string(-12345) == "-12345")
+        self.assertTrue(get_decimal_string(10**4000) == "1" + "0" * 4000)
+        large_number = 12345**400 + 7
+        self.assertTrue(get_decimal_string(large_number) == str(large_number))
+
+    @unittest.skipUnless(
+        hasattr(sys, "set_int_max_str_digits"), "no int max-str-digits limit"
+    )
+    def test_get_integer_above_digit_limit(self):
+        """
+        Round-trip integers longer than the int max-str-digits limit
+        when it is disabled, and verify that the limit is enforced otherwise
+        """
+        original_limit = sys.get_int_max_str_digits()
+        large_number = 9**9999
+        try:
+            sys.set_int_max_str_digits(0)
+            self.assertTrue(
+                get_integer(get_decimal_string(large_number)) == large_number
+            )
+            self.assertTrue(
+                get_integer(get_decimal_string(-large_number)) == -large_number
+            )
+            unicode_string = get_unicode_character_string("MALAYALAM", large_number)
+            self.assertTrue(get_integer(unicode_string) == large_number)
+            with self.assertRaises(ValueError):
+                get_integer("1-2" * 400)
+            with self.assertRaises(ValueError):
+                get_integer("--" + "1" * 1000)
+
+            sys.set_int_max_str_digits(640)
+            self.assertTrue(get_integer("7" * 640) == int("7" * 640))
+            self.assertTrue(get_decimal_string(10**639) == "1" + "0" * 639)
+            with self.assertRaises(ValueError):
+                get_integer("7" * 641)
+            with self.assertRaises(ValueError):
+                get_integer("-" + "7" * 1000)
+            with self.assertRaises(ValueError):
+                get_decimal_string(10**640)
+            with self.assertRaises(ValueError):
+                get_unicode_character_string("MALAYALAM", -large_number)
+        finally:
+            sys.set_int_max_str_digits(original_limit)